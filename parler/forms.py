@@ -1,3 +1,5 @@
+from weakref import WeakKeyDictionary
+
 from django import forms
 from django.core.exceptions import NON_FIELD_ERRORS, ObjectDoesNotExist, ValidationError
 from django.forms.forms import BoundField
@@ -17,6 +19,18 @@ __all__ = (
     #'TranslatableModelFormMetaclass',
 )
 
+# Fields of the translations model that are not copied back to the shared model.
+_NON_TRANSLATED_FIELDS = frozenset(('id', 'master_id', 'language_code'))
+
+# Data that never changes once the models are loaded, stored per model class by _get_model_cached().
+# A plain dict is sufficient, the app registry keeps the model classes alive anyway.
+_MODEL_CACHE = {}
+
+# The placeholders found in the MRO of a form class, used by _get_mro_placeholders().
+# Weakly referenced, as the admin also constructs form classes per request that become a base class.
+# The values only hold attribute names and TranslatedField objects, not the class itself.
+_BASE_PLACEHOLDERS_CACHE = WeakKeyDictionary()
+
 
 class TranslatedField(object):
     """
@@ -32,6 +46,7 @@ class TranslatedField(object):
 
             description = TranslatedField(form_class=forms.CharField, widget=TinyMCE)
     """
+    __slots__ = ('kwargs',)
 
     def __init__(self, **kwargs):
         # The metaclass performs the magic replacement with the actual formfield.
@@ -46,11 +61,15 @@ class BaseTranslatableModelForm(forms.BaseModelForm):
 
     def __init__(self, *args, **kwargs):
         current_language = kwargs.pop('_current_language', None)   # Used for TranslatableViewMixin
+        instance = kwargs.get('instance', None)
         super(BaseTranslatableModelForm, self).__init__(*args, **kwargs)
 
-        # Load the initial values for the translated fields
-        instance = kwargs.get('instance', None)
-        if instance:
+        if instance is None:
+            # Typically already set by admin
+            if self.language_code is None:
+                self.language_code = current_language or get_language()
+        else:
+            # Load the initial values for the translated fields
             for meta in instance._parler_meta:
                 try:
                     # By not auto creating a model, any template code that reads the fields
@@ -60,22 +79,21 @@ class BaseTranslatableModelForm(forms.BaseModelForm):
                 except TranslationDoesNotExist:
                     pass
                 else:
-                    for field in meta.get_translated_fields():
+                    initial = self.initial
+                    for field in _get_translated_fields(meta.model):
+                        if field in initial:
+                            continue
+
                         try:
                             value = getattr(translation, field)
-                            prepared_value = translation._meta.get_field(field).get_prep_value(value)
-                            self.initial.setdefault(field, prepared_value)
+                            initial[field] = translation._meta.get_field(field).get_prep_value(value)
                         except ObjectDoesNotExist:
                             # This occurs when a ForeignKey field is part of the translation,
                             # but it's value is still not yet, and the field has null=False.
                             pass
 
-        # Typically already set by admin
-        if self.language_code is None:
-            if instance:
+            if self.language_code is None:
                 self.language_code = instance.get_current_language()
-            else:
-                self.language_code = current_language or get_language()
 
         try:
             get_supported_language_variant(self.language_code)
@@ -93,7 +111,7 @@ class BaseTranslatableModelForm(forms.BaseModelForm):
 
         # This is the same logic as Django's _get_validation_exclusions(),
         # only using the translation model instead of the master instance.
-        for field_name in translation.get_translated_fields():
+        for field_name in _get_translated_fields(translation.__class__):
             if field_name not in self.fields:
                 # Exclude fields that aren't on the form.
                 exclude.append(field_name)
@@ -104,7 +122,7 @@ class BaseTranslatableModelForm(forms.BaseModelForm):
             elif self._meta.exclude and field_name in self._meta.exclude:
                 # Same for exclude.
                 exclude.append(field_name)
-            elif field_name in self._errors.keys():
+            elif field_name in self._errors:
                 # No need to validate fields that already failed.
                 exclude.append(field_name)
             else:
@@ -121,7 +139,8 @@ class BaseTranslatableModelForm(forms.BaseModelForm):
     def _post_clean(self):
         # Copy the translated fields into the model
         # Make sure the language code is set as early as possible (so it's active during most clean() methods)
-        self.instance.set_current_language(self.language_code)
+        if self.instance.get_current_language() != self.language_code:
+            self.instance.set_current_language(self.language_code)
         self.save_translated_fields()
 
         # Perform the regular clean checks, this also updates self.instance
@@ -131,27 +150,25 @@ class BaseTranslatableModelForm(forms.BaseModelForm):
         """
         Save all translated fields.
         """
-        fields = {}
-
         # Collect all translated fields {'name': 'value'}
-        for field in self._translated_fields:
-            try:
-                value = self.cleaned_data[field]
-            except KeyError:  # Field has a ValidationError
-                continue
-            fields[field] = value
+        # Fields that have a ValidationError are not part of the cleaned_data.
+        # The fields are checked per instance, as __init__() may add or remove fields.
+        cleaned_data = self.cleaned_data
+        fields = dict(
+            (field, cleaned_data[field])
+            for field in self._translated_fields_set.intersection(self.fields).intersection(cleaned_data)
+        )
 
         # Set the field values on their relevant models
         translations = self.instance._set_translated_fields(**fields)
 
         # Perform full clean on models
-        non_translated_fields = set(('id', 'master_id', 'language_code'))
         for translation in translations:
             self._post_clean_translation(translation)
 
             # Assign translated fields to the model (using the TranslatedAttribute descriptor)
             for field in translation._get_field_names():
-                if field in non_translated_fields:
+                if field in _NON_TRANSLATED_FIELDS:
                     continue
                 setattr(self.instance, field, getattr(translation, field))
 
@@ -172,16 +189,32 @@ class BaseTranslatableModelForm(forms.BaseModelForm):
 
     @cached_property
     def _translated_fields(self):
-        field_names = self._meta.model._parler_meta.get_all_fields()
-        return [f_name for f_name in field_names if f_name in self.fields]
+        # Fallback for forms that are not constructed by the TranslatableModelFormMetaclass,
+        # which assigns this as class attribute instead.
+        return _get_all_translated_fields(self._meta.model)
+
+    @cached_property
+    def _translated_fields_set(self):
+        return frozenset(self._translated_fields)
 
     def __getitem__(self, name):
         """
         Return a :class:`TranslatableBoundField` for translated models.
         This extends the default ``form[field]`` interface that produces the BoundField for HTML templates.
         """
+        # Django caches the BoundField objects, these are already upgraded at the first access.
+        # Only return them for fields that are still part of the form, like Django does.
+        if name in self.fields:
+            try:
+                return self._bound_fields_cache[name]
+            except KeyError:
+                pass
+
+        # The field.get_bound_field() call in Django still decides which class is used,
+        # so other BoundField subclasses can be combined with TranslatableBoundField.
+        # That call also raises a KeyError when the field is not part of self.fields.
         boundfield = super(BaseTranslatableModelForm, self).__getitem__(name)
-        if name in self._translated_fields:
+        if name in self._translated_fields_set:
             # Oh the wonders of Python :)
             boundfield.__class__ = _upgrade_boundfield_class(boundfield.__class__)
         return boundfield
@@ -212,14 +245,17 @@ class TranslatableBoundField(BoundField):
     """
     Decorating the regular BoundField to distinguish translatable fields in the admin.
     """
+    # No instance attributes are added, this also keeps the __class__ assignment in __getitem__ compatible.
+    __slots__ = ()
+
     #: A tagging attribute, making it easy for templates to identify these fields
     is_translatable = True
 
     def label_tag(self, contents=None, attrs=None, *args, **kwargs):  # extra args differ per Django version
-        if attrs is None:
-            attrs = {}
-
-        attrs['class'] = (attrs.get('class', '') + " translatable-field").strip()
+        # Copy the attrs, so the caller's dict is not modified.
+        css_class = attrs.get('class') if attrs else None
+        attrs = dict(attrs) if attrs else {}
+        attrs['class'] = css_class + ' translatable-field' if css_class else 'translatable-field'
         return super(TranslatableBoundField, self).label_tag(contents, attrs, *args, **kwargs)
 
     # The as_widget() won't be overwritten to add a 'class' attr,
@@ -241,69 +277,217 @@ class TranslatableModelFormMetaclass(ModelFormMetaclass):
             # Read the model from the 'Meta' attribute. This even works in the admin,
             # as `modelform_factory()` includes a 'Meta' attribute.
             # The other options can be read from the base classes.
-            form_new_meta = attrs.get('Meta', form_meta)
-            form_model = form_new_meta.model if form_new_meta else form_meta.model
+            form_model, fields, exclude, widgets = _get_meta_options(form_meta, attrs.get('Meta'))
 
             # Detect all placeholders at this class level.
-            placeholder_fields = [
-                f_name for f_name, attr_value in six.iteritems(attrs) if isinstance(attr_value, TranslatedField)
-            ]
+            placeholder_fields = dict(
+                (f_name, attr_value) for f_name, attr_value in attrs.items() if isinstance(attr_value, TranslatedField)
+            )
 
             # Include the translated fields as attributes, pretend that these exist on the form.
             # This also works when assigning `form = TranslatableModelForm` in the admin,
             # since the admin always uses modelform_factory() on the form class, and therefore triggering this metaclass.
             if form_model:
-                for translations_model in form_model._parler_meta.get_all_models():
-                    fields = getattr(form_new_meta, 'fields', form_meta.fields)
-                    exclude = getattr(form_new_meta, 'exclude', form_meta.exclude) or ()
-                    widgets = getattr(form_new_meta, 'widgets', form_meta.widgets) or ()
-                    formfield_callback = attrs.get('formfield_callback', None)
-
-                    if fields == '__all__':
-                        fields = None
-
-                    for f_name in translations_model.get_translated_fields():
-                        # Add translated field if not already added, and respect exclude options.
-                        if f_name in placeholder_fields:
-                            # The TranslatedField placeholder can be replaced directly with actual field, so do that.
-                            attrs[f_name] = _get_model_form_field(translations_model, f_name, formfield_callback=formfield_callback, **attrs[f_name].kwargs)
-
-                        # The next code holds the same logic as fields_for_model()
-                        # The f.editable check happens in _get_model_form_field()
-                        elif f_name not in form_base_fields \
-                         and (fields is None or f_name in fields) \
-                         and f_name not in exclude \
-                         and not f_name in attrs:
-                            # Get declared widget kwargs
-                            if f_name in widgets:
-                                # Not combined with declared fields (e.g. the TranslatedField placeholder)
-                                kwargs = {'widget': widgets[f_name]}
-                            else:
-                                kwargs = {}
-
-                            # See if this formfield was previously defined using a TranslatedField placeholder.
-                            placeholder = _get_mro_attribute(bases, f_name)
-                            if placeholder and isinstance(placeholder, TranslatedField):
-                                kwargs.update(placeholder.kwargs)
-
-                            # Add the form field as attribute to the class.
-                            formfield = _get_model_form_field(translations_model, f_name, formfield_callback=formfield_callback, **kwargs)
-                            if formfield is not None:
-                                attrs[f_name] = formfield
+                widgets = widgets or {}
+                formfield_callback = attrs.get('formfield_callback', None)
+
+                # The TranslatedField placeholder can be replaced directly with actual field, so do that.
+                if placeholder_fields:
+                    for translations_model in _get_all_translations_models(form_model):
+                        for f_name in _get_translated_fields(translations_model):
+                            placeholder = placeholder_fields.get(f_name)
+                            if placeholder is not None:
+                                attrs[f_name] = _get_model_form_field(translations_model, f_name, formfield_callback=formfield_callback, **placeholder.kwargs)
+
+                # Placeholders declared at a previous class level, resolved in a single pass.
+                # This is done lazily, as subclasses (e.g. made by modelform_factory()) typically
+                # have all translated fields in the base_fields already, and never need the MRO walk.
+                base_placeholders = None
+
+                # When all translated fields are already provided by the base class (e.g. modelform_factory()
+                # on a form that declares a Meta.model), there is nothing to select or construct.
+                if _get_all_translated_fields_set(form_model).issubset(form_base_fields):
+                    translated_form_fields = ()
+                else:
+                    # Sets for the membership tests, fields_set is None when all fields are included.
+                    fields_set = frozenset(fields) if fields is not None and fields != '__all__' else None
+                    exclude_set = frozenset(exclude or ())
+                    translated_form_fields = _get_translated_form_fields(form_model, fields_set, exclude_set)
+
+                # Add translated field if not already added, and respect exclude options.
+                # The next code holds the same logic as fields_for_model(),
+                # each class receives new formfield instances.
+                # The f.editable check happens in _get_model_form_field()
+                for translations_model, f_name in translated_form_fields:
+                    if f_name in form_base_fields or f_name in attrs:
+                        continue
+
+                    # Get declared widget kwargs
+                    if f_name in widgets:
+                        # Not combined with declared fields (e.g. the TranslatedField placeholder)
+                        kwargs = {'widget': widgets[f_name]}
+                    else:
+                        kwargs = {}
+
+                    # See if this formfield was previously defined using a TranslatedField placeholder.
+                    if base_placeholders is None:
+                        base_placeholders = _get_mro_placeholders(bases)
+                    placeholder = base_placeholders.get(f_name)
+                    if placeholder is not None:
+                        kwargs.update(placeholder.kwargs)
+
+                    # Add the form field as attribute to the class.
+                    formfield = _get_model_form_field(translations_model, f_name, formfield_callback=formfield_callback, **kwargs)
+                    if formfield is not None:
+                        attrs[f_name] = formfield
 
         # Call the super class with updated `attrs` dict.
-        return super(TranslatableModelFormMetaclass, mcs).__new__(mcs, name, bases, attrs)
+        new_class = super(TranslatableModelFormMetaclass, mcs).__new__(mcs, name, bases, attrs)
+
+        # The translated fields of the model only depend on the form class, so store them once at the class.
+        # These are the candidates; the form instance checks which of them are part of self.fields.
+        # When the base class has the same model (e.g. with modelform_factory()), the values are inherited.
+        new_model = new_class._meta.model
+        if new_model is None:
+            new_class._translated_fields = ()
+            new_class._translated_fields_set = frozenset()
+        elif form_meta is None or new_model is not form_meta.model:
+            new_class._translated_fields = _get_all_translated_fields(new_model)
+            new_class._translated_fields_set = _get_all_translated_fields_set(new_model)
+
+        return new_class
+
+
+def _get_model_cached(model, key, func):
+    """
+    Return ``func(model)``, which is calculated only once per model class and key.
+    """
+    try:
+        model_cache = _MODEL_CACHE[model]
+    except KeyError:
+        model_cache = _MODEL_CACHE[model] = {}
+
+    try:
+        return model_cache[key]
+    except KeyError:
+        value = model_cache[key] = func(model)
+        return value
+
+
+def _get_all_translated_fields(model):
+    """
+    Return the names of all translated fields of a shared model.
+    """
+    return _get_model_cached(model, 'all_fields', lambda model: tuple(model._parler_meta.get_all_fields()))
+
+
+def _get_all_translated_fields_set(model):
+    """
+    Return the names of all translated fields of a shared model as set.
+    """
+    return _get_model_cached(model, 'all_fields_set', lambda model: frozenset(_get_all_translated_fields(model)))
+
+
+def _get_all_translations_models(model):
+    """
+    Return all translations models of a shared model.
+    """
+    return _get_model_cached(model, 'all_models', lambda model: tuple(model._parler_meta.get_all_models()))
+
+
+def _get_translated_fields(translations_model):
+    """
+    Return the names of the translated fields of a single translations model.
+    """
+    return _get_model_cached(translations_model, 'fields', lambda model: tuple(model.get_translated_fields()))
+
+
+def _get_translated_form_fields(form_model, fields_set, exclude_set):
+    """
+    Return the ``(translations_model, field_name)`` pairs which the ``fields`` and ``exclude`` options include.
+    These only hold names and model classes, the formfields are constructed for each form class.
+    """
+    def _filter_fields(model):
+        return tuple(
+            (translations_model, f_name)
+            for translations_model in _get_all_translations_models(model)
+            for f_name in _get_translated_fields(translations_model)
+            if (fields_set is None or f_name in fields_set) and f_name not in exclude_set
+        )
+
+    return _get_model_cached(form_model, ('form_fields', fields_set, exclude_set), _filter_fields)
+
+
+def _get_meta_options(form_meta, form_new_meta):
+    """
+    Return the ``model``, ``fields``, ``exclude`` and ``widgets`` options for a new form class.
+    Options that are not declared in the new ``Meta`` are taken from the base class.
+    """
+    if form_new_meta is None:
+        return form_meta.model, form_meta.fields, form_meta.exclude, form_meta.widgets
+
+    return (
+        form_new_meta.model,
+        getattr(form_new_meta, 'fields', form_meta.fields),
+        getattr(form_new_meta, 'exclude', form_meta.exclude),
+        getattr(form_new_meta, 'widgets', form_meta.widgets),
+    )
+
+
+_SENTINEL = object()
 
 
 def _get_mro_attribute(bases, name, default=None):
     for base in bases:
-        try:
-            return getattr(base, name)
-        except AttributeError:
-            continue
+        value = getattr(base, name, _SENTINEL)
+        if value is not _SENTINEL:
+            return value
     return default
 
 
+def _get_mro_placeholders(bases):
+    """
+    Return all :class:`TranslatedField` placeholders defined in the base classes.
+    This follows the same lookup order as :func:`_get_mro_attribute`,
+    but the class hierarchy of each base is only walked once.
+    """
+    if len(bases) == 1:
+        return _get_base_placeholders(bases[0])[1]
+
+    placeholders = {}
+    found_names = set()
+    for base in bases:
+        attr_names, base_placeholders = _get_base_placeholders(base)
+        for attr_name, attr_value in base_placeholders.items():
+            # An attribute of a previous base has precedence, even when it's not a placeholder.
+            if attr_name not in found_names:
+                placeholders[attr_name] = attr_value
+        found_names.update(attr_names)
+
+    return placeholders
+
+
+def _get_base_placeholders(base):
+    """
+    Return the attribute names that a base class provides, and its :class:`TranslatedField` placeholders.
+    """
+    try:
+        return _BASE_PLACEHOLDERS_CACHE[base]
+    except KeyError:
+        pass
+
+    attributes = {}
+    for klass in base.__mro__:
+        for attr_name, attr_value in klass.__dict__.items():
+            attributes.setdefault(attr_name, attr_value)
+
+    placeholders = dict(
+        (attr_name, attr_value) for attr_name, attr_value in attributes.items() if isinstance(attr_value, TranslatedField)
+    )
+    result = _BASE_PLACEHOLDERS_CACHE[base] = (frozenset(attributes), placeholders)
+    return result
+
+
 def _get_model_form_field(model, name, formfield_callback=None, **kwargs):
     """
     Utility to create the formfield from a model field.
@@ -331,11 +515,14 @@ class TranslatableModelForm(six.with_metaclass(TranslatableModelFormMetaclass, B
 
     # The multiple parent classes are needed in django 1.7 to pass check admin.E016:
     #       "The value of 'form' must inherit from 'BaseModelForm'"
-    # so we use our copied version in parler.utils.compat
     #
     # Also, the class must inherit from ModelForm,
     # or the ModelFormMetaclass will skip initialization.
     # It only adds the _meta from anything that extends ModelForm.
+    #
+    # six.with_metaclass() is used as long as Python 2.7 is supported.
+    # It calls the metaclass once with the bases above, and doesn't leave
+    # a temporary class in the MRO that _get_mro_attribute() has to walk.
 
 
 class TranslatableBaseInlineFormSet(BaseInlineFormSet):
@@ -349,10 +536,6 @@ class TranslatableBaseInlineFormSet(BaseInlineFormSet):
         form.language_code = self.language_code   # Pass the language code for new objects!
         return form
 
-    def save_new(self, form, commit=True):
-        obj = super(TranslatableBaseInlineFormSet, self).save_new(form, commit)
-        return obj
-
 
 # Backwards compatibility
 TranslatableModelFormMixin = BaseTranslatableModelForm
@@ -1,6 +1,8 @@
+from django import forms
 from django.core.exceptions import ValidationError
+from django.forms.models import modelform_factory
 from django.utils import translation
-from parler.forms import TranslatableModelForm
+from parler.forms import TranslatableModelForm, TranslatedField
 from .utils import AppTestCase
 from .testapp.models import SimpleModel, UniqueTogetherModel, ForeignKeyTranslationModel, RegularModel, CleanFieldModel
 
@@ -55,6 +57,108 @@ class FormTests(AppTestCase):
         self.assertTrue('shared' in SimpleForm.base_fields)
         self.assertTrue('tr_title' in SimpleForm.base_fields)
 
+    def test_form_inherited_placeholder(self):
+        """
+        Check that a TranslatedField placeholder of a base class is applied in the subclass.
+        """
+        class BasePlaceholderForm(TranslatableModelForm):
+            tr_title = TranslatedField(widget=forms.Textarea)
+
+        class PlaceholderForm(BasePlaceholderForm):
+            class Meta:
+                model = SimpleModel
+                fields = '__all__'
+
+        self.assertIsInstance(PlaceholderForm.base_fields['tr_title'].widget, forms.Textarea)
+
+    def test_form_translated_fields(self):
+        """
+        Check that the translated fields are known at the form class.
+        """
+        self.assertEqual(SimpleForm._translated_fields, ('tr_title',))
+        self.assertEqual(SimpleForm._translated_fields_set, frozenset(['tr_title']))
+        self.assertEqual(SimpleForm()._translated_fields, ('tr_title',))
+
+    def test_form_save_field_added_in_init(self):
+        """
+        Check that a translated field which is added in __init__() is saved too.
+        """
+        class InitFieldForm(TranslatableModelForm):
+            class Meta:
+                model = SimpleModel
+                fields = ('shared',)
+
+            def __init__(self, *args, **kwargs):
+                super(InitFieldForm, self).__init__(*args, **kwargs)
+                self.fields['tr_title'] = forms.CharField()
+
+        self.assertNotIn('tr_title', InitFieldForm.base_fields)
+
+        with translation.override('en'):
+            x = InitFieldForm(data={'shared': 'SHARED', 'tr_title': 'TRANS'})
+            self.assertTrue(x.is_valid())
+            self.assertTrue(x['tr_title'].is_translatable)
+            instance = x.save()
+
+        x = SimpleModel.objects.language('en').get(pk=instance.pk)
+        self.assertEqual(x.tr_title, 'TRANS')
+
+    def test_form_factory_reuse(self):
+        """
+        Check that constructing the same form again gives each class its own translated formfields.
+        """
+        FormA = modelform_factory(SimpleModel, form=TranslatableModelForm, fields=('shared', 'tr_title'))
+        FormB = modelform_factory(SimpleModel, form=TranslatableModelForm, fields=('shared', 'tr_title'))
+        self.assertIsNot(FormA.base_fields['tr_title'], FormB.base_fields['tr_title'])
+
+        FormA.base_fields['tr_title'].required = False
+        self.assertTrue(FormB.base_fields['tr_title'].required)
+
+        FormW = modelform_factory(SimpleModel, form=TranslatableModelForm, fields=('shared', 'tr_title'), widgets={'tr_title': forms.Textarea()})
+        self.assertIsInstance(FormW.base_fields['tr_title'].widget, forms.Textarea)
+
+        FormC = modelform_factory(SimpleModel, form=TranslatableModelForm, fields=('shared',))
+        self.assertNotIn('tr_title', FormC.base_fields)
+
+    def test_form_initial(self):
+        """
+        Check that the translated values of the instance are used as initial data.
+        """
+        x = SimpleModel.objects.create(shared='SHARED', tr_title='TRANS', _current_language='nl')
+
+        form = SimpleForm(instance=x)
+        self.assertEqual(form.initial['tr_title'], 'TRANS')
+        self.assertEqual(form.language_code, 'nl')
+
+        form = SimpleForm(instance=x, initial={'tr_title': 'INITIAL'})
+        self.assertEqual(form.initial['tr_title'], 'INITIAL')
+
+    def test_form_bound_field_cache(self):
+        """
+        Check that cached bound fields are reused, but not for removed fields.
+        """
+        form = SimpleForm()
+        boundfield = form['tr_title']
+        self.assertIs(form['tr_title'], boundfield)
+        self.assertTrue(boundfield.is_translatable)
+
+        del form.fields['tr_title']
+        with self.assertRaises(KeyError):
+            form['tr_title']
+
+    def test_form_label_tag(self):
+        """
+        Check that translated fields are marked in the label.
+        """
+        form = SimpleForm()
+        self.assertTrue(form['tr_title'].is_translatable)
+        self.assertIn('class="translatable-field"', form['tr_title'].label_tag())
+        self.assertNotIn('translatable-field', form['shared'].label_tag())
+
+        attrs = {'class': 'required'}
+        self.assertIn('class="required translatable-field"', form['tr_title'].label_tag(attrs=attrs))
+        self.assertEqual(attrs, {'class': 'required'})
+
     def test_form_save(self):
         """
         Check if the form receives and stores data.